@@ -0,0 +1,118 @@
+"""
+Kernels numéricos de bajo nivel usados por EstadisticaBase.
+Si Numba está instalado se compilan a código máquina; si no, se usan
+equivalentes en NumPy con el mismo resultado.
+"""
+from itertools import product
+from math import isfinite
+
+import numpy as np
+
+try:
+    from numba import njit, prange, types # Opcional: compila los kernels numéricos a código máquina
+except ImportError:
+    njit = None
+
+
+def _all_stats_numpy(x):
+    """Versión en NumPy de all_stats (referencia y respaldo del kernel de Numba)."""
+    n = x.size
+    if n == 0:
+        return n, float('nan'), float('nan'), float('nan'), float('nan')
+    with np.errstate(invalid='ignore', over='ignore'): # inf - inf = nan, igual que el kernel
+        varianza = float(x.var(ddof=1)) if n > 1 else float('nan')
+        media = float(x.mean())
+    return n, media, varianza, float(x.min()), float(x.max())
+
+
+def _batch_stats_numpy(offsets, datos, out_media, out_varianza):
+    """Versión en NumPy de batch_stats (grupos de al menos 2 observaciones)."""
+    inicios = offsets[:-1]
+    n = np.diff(offsets)
+    out_media[:] = np.add.reduceat(datos, inicios) / n
+    desviaciones = datos - np.repeat(out_media, n)
+    out_varianza[:] = np.add.reduceat(desviaciones * desviaciones, inicios) / (n - 1)
+
+
+if njit is not None:
+    # Firmas explícitas: arreglos float64 1-D contiguos, escribibles y de solo lectura
+    # (pandas devuelve vistas de solo lectura con Copy-on-Write).
+    _RESULTADO_ALL_STATS = types.Tuple((types.int64, types.float64, types.float64,
+                                        types.float64, types.float64))
+    _FIRMAS_ALL_STATS = [
+        _RESULTADO_ALL_STATS(types.Array(types.float64, 1, "C", readonly=solo_lectura))
+        for solo_lectura in (False, True)
+    ]
+    _FIRMAS_BATCH_STATS = [
+        types.void(types.Array(types.int64, 1, "C", readonly=offsets_lectura),
+                   types.Array(types.float64, 1, "C", readonly=datos_lectura),
+                   types.Array(types.float64, 1, "C"),
+                   types.Array(types.float64, 1, "C"))
+        for offsets_lectura, datos_lectura in product((False, True), repeat=2)
+    ]
+
+    @njit(cache=True, nogil=True)
+    def _paso_welford(media, m2, v, k):
+        """Actualiza (media, m2) con el k-ésimo valor v (k empieza en 1)."""
+        delta = v - media
+        media += delta / k
+        m2 += (v - media) * delta
+        return media, m2
+
+    # Con firmas explícitas la compilación ocurre al importar (no en la primera llamada)
+    # y cache=True guarda el código máquina en __pycache__ para las siguientes ejecuciones.
+    @njit(_FIRMAS_ALL_STATS, cache=True, nogil=True)
+    def _all_stats_numba(x):
+        """
+        Calcula (n, media, varianza muestral, mínimo, máximo) en una sola pasada.
+        La media y la varianza usan la recurrencia de Welford (numéricamente estable).
+        """
+        n = x.size
+        if n == 0:
+            return n, np.nan, np.nan, np.nan, np.nan
+        media = 0.0
+        m2 = 0.0
+        minimo = x[0]
+        maximo = x[0]
+        for i in range(n):
+            v = x[i]
+            media, m2 = _paso_welford(media, m2, v, i + 1)
+            minimo = min(minimo, v)
+            maximo = max(maximo, v)
+        varianza = m2 / (n - 1) if n > 1 else np.nan
+        return n, media, varianza, minimo, maximo
+
+    def all_stats(x):
+        """
+        Calcula (n, media, varianza muestral, mínimo, máximo) con el kernel de Numba.
+        Con valores infinitos la recurrencia de Welford produce inf - inf = nan, así que
+        en ese caso (resultado no finito) se usan las reducciones de NumPy.
+        """
+        resultado = _all_stats_numba(x)
+        n, media, varianza, minimo, maximo = resultado
+        if n and not (isfinite(media) and isfinite(minimo) and isfinite(maximo)
+                      and (n < 2 or isfinite(varianza))):
+            return _all_stats_numpy(x)
+        return resultado
+
+    # nogil libera el GIL durante la ejecución y prange reparte los grupos entre núcleos.
+    @njit(_FIRMAS_BATCH_STATS, cache=True, parallel=True, nogil=True)
+    def batch_stats(offsets, datos, out_media, out_varianza):
+        """
+        Calcula la media y la varianza muestral de cada grupo datos[offsets[g]:offsets[g + 1]]
+        con Welford, escribiendo los resultados en out_media y out_varianza.
+        """
+        for g in prange(offsets.size - 1):
+            inicio = offsets[g]
+            fin = offsets[g + 1]
+            media = 0.0
+            m2 = 0.0
+            for i in range(inicio, fin):
+                media, m2 = _paso_welford(media, m2, datos[i], i - inicio + 1)
+            n = fin - inicio
+            out_media[g] = media if n > 0 else np.nan
+            out_varianza[g] = m2 / (n - 1) if n > 1 else np.nan
+else:
+    all_stats = _all_stats_numpy
+
+    batch_stats = _batch_stats_numpy
@@ -1,5 +1,28 @@
 import pandas as pd
 import numpy as np
+from _kernels import all_stats
+
+# Tipos (según pd.api.types.infer_dtype) con los que una lista o arreglo object es numérico
+_TIPOS_NUMERICOS = ("integer", "floating", "mixed-integer-float", "boolean")
+# Tipos de NumPy (dtype.kind) numéricos: enteros, sin signo, flotantes y booleanos
+_KINDS_NUMERICOS = "iufb"
+
+
+def es_numerico(datos):
+    """
+    Criterio único para decidir si los datos son numéricos. Los booleanos sí lo son
+    (True = 1, False = 0); los complejos no, porque convertirlos a float64
+    descartaría la parte imaginaria.
+    Acepta listas, tuplas, np.ndarray o pd.Series; los arreglos object se inspeccionan
+    elemento a elemento, de modo que [1, 2, 3] con dtype object cuenta como numérico.
+    """
+    if isinstance(datos, pd.Series):
+        datos = datos.to_numpy()
+    dtype = getattr(datos, "dtype", None)
+    if dtype is not None and dtype != object:
+        return dtype.kind in _KINDS_NUMERICOS
+    return pd.api.types.infer_dtype(datos, skipna=True) in _TIPOS_NUMERICOS
+
 
 class EstadisticaBase:
     """
@@ -9,20 +32,59 @@ class EstadisticaBase:
     def __init__(self, datos):
         """
         Constructor que recibe los datos y los normaliza a una Serie de Pandas.
+        Si se recibe un np.ndarray, se copia (los resultados se memorizan, así que
+        cambios posteriores del arreglo original no deben afectarlos) y la Serie
+        se construye solo cuando se necesita.
         """
-        if datos is None or (isinstance(datos, (list, tuple)) and not datos):
+        if isinstance(datos, np.ndarray) and datos.ndim != 1:
+            raise ValueError("El arreglo de datos debe ser unidimensional.")
+        if datos is None or (isinstance(datos, (list, tuple, np.ndarray)) and len(datos) == 0):
             raise ValueError("La lista de datos no puede estar vacía.")
             
         # Normalizar datos a pd.Series
-        if isinstance(datos, (list, tuple)):
-            self.datos = pd.Series(datos)
+        if isinstance(datos, np.ndarray):
+            self._datos = None
+            self._arreglo = datos.copy()
+        elif isinstance(datos, (list, tuple)):
+            self._datos = pd.Series(datos)
         elif isinstance(datos, pd.Series):
-            self.datos = datos
+            self._datos = datos
+        else:
+            raise TypeError("El formato de datos debe ser lista, tupla, np.ndarray o pd.Series.")
+
+        # Valores sin nulos convertidos una sola vez a un arreglo contiguo de NumPy.
+        # _values conserva el tipo original (moda); _values_f64 es la vista float64
+        # usada por los métodos numéricos (si los datos no son numéricos, es el mismo arreglo).
+        valores = self._arreglo if self._datos is None else self._datos.to_numpy()
+        if valores.dtype.kind == "f":
+            no_nulos = ~np.isnan(valores)
+        elif valores.dtype.kind in "iub":
+            no_nulos = None  # Enteros y booleanos no pueden contener nulos
         else:
-            raise TypeError("El formato de datos debe ser lista, tupla o pd.Series.")
+            no_nulos = pd.notna(valores)
+        if no_nulos is not None and not no_nulos.all():
+            valores = valores[no_nulos]
+        if valores.dtype == object and es_numerico(valores):
+            valores = pd.to_numeric(valores) # Números guardados como object
+        self._values = np.ascontiguousarray(valores)
 
         # Atributo de encapsulamiento
-        self._n_observaciones = len(self.datos.dropna())
+        self._n_observaciones = self._values.size
+
+        # Tras la conversión basta con mirar el dtype: no se vuelve a recorrer los datos
+        if self._values.dtype.kind in _KINDS_NUMERICOS:
+            self._values_f64 = self._values.astype(np.float64, copy=False)
+        else:
+            self._values_f64 = self._values
+        self._stats = None
+        self._desviacion = None
+
+    @property
+    def datos(self):
+        """Serie de Pandas con los datos (se construye bajo demanda si se recibió un np.ndarray)."""
+        if self._datos is None:
+            self._datos = pd.Series(self._arreglo, copy=False)
+        return self._datos
 
     # Método de Polimorfismo (Será sobrescrito en cualitativos.py y cuantitativos.py)
     def resumen(self):
@@ -46,88 +108,109 @@ class EstadisticaBase:
 # base = EstadisticaBase(datos_prueba)
 # print(base.obtener_n_observaciones())
 
+    def _valores_numericos(self):
+        """Devuelve los valores en float64 o lanza TypeError si los datos no son numéricos."""
+        if self._values_f64.dtype != np.float64:
+            raise TypeError("Los datos deben ser numéricos para calcular esta estadística.")
+        return self._values_f64
+
+    def _estadisticas(self):
+        """
+        Devuelve (n, media, varianza, mínimo, máximo) calculados una sola vez con all_stats.
+        Los datos no cambian tras __init__, por lo que el resultado se memoriza.
+        """
+        if self._stats is None:
+            self._stats = all_stats(self._valores_numericos())
+        return self._stats
+
     def contar_datos(self):
-        """Devuelve la cantidad de elementos en el conjunto de datos."""
-        return len(self.datos)
+        """Devuelve la cantidad de elementos no nulos en el conjunto de datos."""
+        return self._values.size
 
     def suma(self):
         """Calcula la suma total de los valores."""
-        return sum(self.datos)
+        return self._valores_numericos().sum()
 
     def media(self):
-        """Calcula la media aritmética sin funciones externas."""
-        n = self.contar_datos()
-        return self.suma() / n if n > 0 else float('nan')
+        """Calcula la media aritmética de los valores no nulos."""
+        return self._estadisticas()[1]
 
     def mediana(self):
-        """Calcula la mediana ordenando los datos manualmente."""
-        n = self.contar_datos()
+        """Calcula la mediana con una selección parcial (O(n)) en lugar de ordenar."""
+        valores = self._valores_numericos()
+        n = valores.size
         if n == 0:
             return float('nan')
 
-        datos_ordenados = sorted(self.datos)
         mitad = n // 2
+        if n % 2:
+            return float(np.partition(valores, mitad)[mitad])
 
-        return (datos_ordenados[mitad - 1] + datos_ordenados[mitad]) / 2 if n % 2 == 0 else datos_ordenados[mitad]
+        particion = np.partition(valores, [mitad - 1, mitad])
+        return float((particion[mitad - 1] + particion[mitad]) / 2)
 
     def moda(self):
         """Calcula la moda (valor más frecuente)."""
-        n = self.contar_datos()
+        n = self._values.size
         if n == 0:
             return []
 
-        frecuencias = {}
-        for valor in self.datos:
-            frecuencias[valor] = frecuencias.get(valor, 0) + 1
-
-        max_frecuencia = max(frecuencias.values())
+        if self._values.dtype == object:
+            # Tipos mezclados (ej: 'a' y 1) no se pueden ordenar: se cuenta solo con hash
+            codigos, valores = pd.factorize(self._values)
+            frecuencias = np.bincount(codigos)
+        else:
+            valores, frecuencias = np.unique(self._values, return_counts=True)
+        i = frecuencias.argmax()
+        max_frecuencia = frecuencias[i]
 
         # Si todos los valores son únicos, no hay moda
         if max_frecuencia == 1 and n > 1:
             return []
 
-        modas = [valor for valor, freq in frecuencias.items() if freq == max_frecuencia]
-        return modas[0] if len(modas) == 1 else modas
+        # Caso habitual (una sola moda): se devuelve valores[i] sin seleccionar con la máscara
+        if np.count_nonzero(frecuencias == max_frecuencia) == 1:
+            return valores[i] if valores.dtype == object else valores[i].item()
+
+        return valores[frecuencias == max_frecuencia].tolist()
 
     def varianza(self):
         """Calcula la varianza muestral."""
-        n = self.contar_datos()
-        if n < 2:
-            return float('nan')
+        return self._estadisticas()[2]
+
+    def desviacion_estandar(self):
+        """Calcula la desviación estándar muestral (se memoriza tras la primera llamada)."""
+        if self._desviacion is None:
+            self._desviacion = float(np.sqrt(self.varianza()))
+        return self._desviacion
+
+    def rango(self):
+        """Devuelve el rango estadístico: diferencia entre el valor máximo y mínimo."""
+        n, _, _, minimo, maximo = self._estadisticas()
+        if n == 0:
+            return float('nan')  # No se puede calcular el rango sin datos
 
+        return float(maximo - minimo)
+
+    def coeficiente_variacion(self):
+        """
+        Calcula el Coeficiente de Variación (CV) de Pearson.
+        El CV mide la dispersión relativa como porcentaje de la media.
+        """
         media = self.media()
-        suma_cuadrados = sum((valor - media) ** 2 for valor in self.datos)
-        return suma_cuadrados / (n - 1)
+        desviacion = self.desviacion_estandar()
 
-    def desviacion_estandar(self):
-        """Calcula la desviación estándar como raíz cuadrada de la varianza."""
-        return np.sqrt(self.varianza())
-def rango(self):
-    """Devuelve el rango estadístico: diferencia entre el valor máximo y mínimo."""
-    if not self.datos:
-        return float('nan')  # No se puede calcular el rango sin datos
+        # Validación: si media o desviación estándar no son válidas
+        if np.isnan(media) or np.isnan(desviacion):
+            return float('nan')
 
-    return max(self.datos) - min(self.datos)
+        # Casos especiales: media igual a cero
+        if media == 0:
+            # Si todos los datos son cero, no hay variabilidad
+            if desviacion == 0:
+                return 0.0
+            # Si hay variabilidad pero la media es cero, el CV es indefinido (infinito)
+            return float('inf')
 
-def coeficiente_variacion(self):
-    """
-    Calcula el Coeficiente de Variación (CV) de Pearson.
-    El CV mide la dispersión relativa como porcentaje de la media.
-    """
-    media = self.media()
-    desviacion = self.desviacion_estandar()
-
-    # Validación: si media o desviación estándar no son válidas
-    if np.isnan(media) or np.isnan(desviacion):
-        return float('nan')
-
-    # Casos especiales: media igual a cero
-    if media == 0:
-        # Si todos los datos son cero, no hay variabilidad
-        if desviacion == 0:
-            return 0.0
-        # Si hay variabilidad pero la media es cero, el CV es indefinido (infinito)
-        return float('inf')
-
-    # Cálculo estándar del CV como porcentaje
-    return (desviacion / media) * 100
\ No newline at end of file
+        # Cálculo estándar del CV como porcentaje
+        return (desviacion / media) * 100
\ No newline at end of file
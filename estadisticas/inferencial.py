@@ -1,7 +1,29 @@
+from functools import lru_cache
+from math import sqrt
+import numpy as np
 import pandas as pd
 from scipy import stats # Necesario para valores críticos (t y Z)
 # Asume que tu clase base extendida está en un archivo importable
-from base import EstadisticaBase 
+from base import EstadisticaBase, es_numerico
+from _kernels import batch_stats
+
+
+@lru_cache(maxsize=128)
+def _t_critico(nivel_confianza, grados_libertad):
+    """Valor crítico t de Student (bilateral), memorizado por (nivel, gl)."""
+    return float(stats.t.ppf(1 - (1 - nivel_confianza) / 2, grados_libertad))
+
+
+@lru_cache(maxsize=128)
+def _z_critico(nivel_confianza):
+    """Valor crítico Z de la normal estándar (bilateral), memorizado por nivel."""
+    return float(stats.norm.ppf(1 - (1 - nivel_confianza) / 2))
+
+
+def _t_criticos(nivel_confianza, grados_libertad):
+    """Versión vectorizada de _t_critico para un arreglo de grados de libertad."""
+    return stats.t.ppf(1 - (1 - nivel_confianza) / 2, np.asarray(grados_libertad))
+
 
 class InferenciaEstadistica(EstadisticaBase):
     """
@@ -9,6 +31,16 @@ class InferenciaEstadistica(EstadisticaBase):
     utilizando métodos de la clase EstadisticaBase.
     """
     
+    def __new__(cls, datos=None):
+        """
+        Elige una sola vez, según el tipo de los datos, la subclase especializada:
+        InferenciaCuantitativa (datos numéricos) o InferenciaCualitativa (el resto).
+        """
+        if cls is InferenciaEstadistica:
+            es_valido = isinstance(datos, (list, tuple, np.ndarray, pd.Series))
+            cls = InferenciaCuantitativa if es_valido and es_numerico(datos) else InferenciaCualitativa
+        return super().__new__(cls)
+
     def __init__(self, datos):
         """Inicializa la clase base y asegura que haya suficientes datos."""
         super().__init__(datos)
@@ -27,21 +59,19 @@ class InferenciaEstadistica(EstadisticaBase):
         :param nivel_confianza: Nivel de confianza (ej: 0.95 para 95%).
         :return: Tupla (Límite Inferior, Límite Superior).
         """
-        datos_cuantitativos = self.obtener_datos().astype(float) # Aseguramos tipo numérico
-        
         try:
             media = self.media()
-            ds = self.desviacion_estandar() 
+            ds = self.desviacion_estandar()
         except TypeError:
             raise TypeError("Los datos deben ser numéricos para calcular el IC de la media.")
-            
+        
         grados_libertad = self._n - 1
         
         # Valor crítico t de Student: (1 - (1 - 0.95)/2) = 0.975 para 95%
-        t_critico = stats.t.ppf(1 - (1 - nivel_confianza) / 2, grados_libertad)
+        t_critico = _t_critico(nivel_confianza, grados_libertad)
         
         # Error Estándar de la Media
-        error_estandar = ds / (self._n ** 0.5)
+        error_estandar = ds / sqrt(self._n)
         
         # Margen de Error
         margen_error = t_critico * error_estandar
@@ -51,6 +81,84 @@ class InferenciaEstadistica(EstadisticaBase):
         
         return (limite_inferior, limite_superior)
 
+    # --- Métodos de Inferencia para la Media de varios grupos (Cuantitativa) ---
+    
+    @classmethod
+    def intervalo_confianza_media_batch(cls, datos_2d, nivel_confianza=0.95):
+        """
+        Calcula el IC de la media para varios grupos del mismo tamaño a la vez,
+        sin crear una instancia por grupo.
+        Como en la inferencia de una sola muestra, los NaN se descartan: cada fila
+        usa solo sus observaciones válidas (y sus propios grados de libertad).
+        
+        :param datos_2d: Arreglo de forma (grupos, n), una fila por grupo.
+        :param nivel_confianza: Nivel de confianza (ej: 0.95 para 95%).
+        :return: Tupla de arreglos (Límites Inferiores, Límites Superiores).
+        """
+        datos_2d = np.asarray(datos_2d, dtype=np.float64)
+        if datos_2d.ndim != 2:
+            raise ValueError("Los datos deben ser un arreglo 2-D de forma (grupos, n).")
+        
+        no_nulos = ~np.isnan(datos_2d)
+        if no_nulos.all():
+            # Mismo n en todos los grupos: un solo valor crítico (memorizado) que se difunde
+            n = datos_2d.shape[1]
+            if n < 2:
+                raise ValueError("Se requieren al menos 2 observaciones para la inferencia.")
+            medias = datos_2d.mean(axis=1)
+            ds = datos_2d.std(axis=1, ddof=1)
+            t_critico = _t_critico(nivel_confianza, n - 1)
+        else:
+            n = no_nulos.sum(axis=1)
+            if (n < 2).any():
+                raise ValueError("Se requieren al menos 2 observaciones por grupo para la inferencia.")
+            medias = np.nanmean(datos_2d, axis=1)
+            ds = np.nanstd(datos_2d, axis=1, ddof=1)
+            t_critico = _t_criticos(nivel_confianza, n - 1)
+        
+        margen_error = t_critico * ds / np.sqrt(n)
+        
+        return (medias - margen_error, medias + margen_error)
+
+    @classmethod
+    def intervalo_confianza_media_grupos(cls, datos, offsets, nivel_confianza=0.95):
+        """
+        Calcula el IC de la media para grupos de distinto tamaño a la vez.
+        Los grupos se procesan en paralelo y sin el GIL cuando Numba está disponible.
+        Como en la inferencia de una sola muestra, los NaN se descartan de cada grupo.
+        
+        :param datos: Arreglo 1-D con los datos de todos los grupos concatenados.
+        :param offsets: Límites de los grupos: el grupo g es datos[offsets[g]:offsets[g + 1]].
+        :param nivel_confianza: Nivel de confianza (ej: 0.95 para 95%).
+        :return: Tupla de arreglos (Límites Inferiores, Límites Superiores).
+        """
+        datos = np.ascontiguousarray(datos, dtype=np.float64)
+        offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        if datos.ndim != 1 or offsets.ndim != 1 or offsets.size < 2:
+            raise ValueError("Se requiere un arreglo 1-D de datos y al menos 2 offsets.")
+        if offsets[0] != 0 or offsets[-1] != datos.size:
+            raise ValueError("Los offsets deben empezar en 0 y terminar en len(datos).")
+        
+        n = np.diff(offsets)
+        no_nulos = ~np.isnan(datos)
+        if not no_nulos.all():
+            if (n == 0).any():
+                raise ValueError("Se requieren al menos 2 observaciones por grupo para la inferencia.")
+            n = np.add.reduceat(no_nulos, offsets[:-1]).astype(np.int64)
+            datos = datos[no_nulos]
+            offsets = np.concatenate(([0], np.cumsum(n)))
+        if (n < 2).any():
+            raise ValueError("Se requieren al menos 2 observaciones por grupo para la inferencia.")
+        
+        medias = np.empty(n.size)
+        varianzas = np.empty(n.size)
+        batch_stats(offsets, datos, medias, varianzas)
+        
+        t_critico = _t_criticos(nivel_confianza, n - 1)
+        margen_error = t_critico * np.sqrt(varianzas / n)
+        
+        return (medias - margen_error, medias + margen_error)
+
     # --- Métodos de Inferencia para la Proporción (Cualitativa) ---
 
     def intervalo_confianza_proporcion(self, valor_exito, nivel_confianza=0.95):
@@ -62,19 +170,16 @@ class InferenciaEstadistica(EstadisticaBase):
         :param nivel_confianza: Nivel de confianza (ej: 0.95 para 95%).
         :return: Tupla (Límite Inferior, Límite Superior).
         """
-        datos_categoricos = self.obtener_datos()
-        
         # 1. Obtener la Proporción Muestral (p_hat)
-        conteo_exito = (datos_categoricos == valor_exito).sum()
+        conteo_exito = self._contar_exitos(valor_exito)
         p_hat = conteo_exito / self._n
         q_hat = 1 - p_hat
         
         # 2. Valor crítico Z (distribución normal estándar)
-        z_critico = stats.norm.ppf(1 - (1 - nivel_confianza) / 2)
+        z_critico = _z_critico(nivel_confianza)
 
         # 3. Error Estándar de la Proporción
-        # np.sqrt(p_hat * q_hat / self._n)
-        error_estandar = (p_hat * q_hat / self._n) ** 0.5
+        error_estandar = sqrt(p_hat * q_hat / self._n)
         
         # 4. Margen de Error
         margen_error = z_critico * error_estandar
@@ -84,12 +189,17 @@ class InferenciaEstadistica(EstadisticaBase):
         
         return (limite_inferior, limite_superior)
 
+    def _contar_exitos(self, valor_exito):
+        """Cuenta las observaciones iguales a valor_exito."""
+        return int(np.count_nonzero(self._values == valor_exito))
+
     # --- Polimorfismo / Implementación de resumen() ---
     
     def resumen(self):
         """
         Proporciona un resumen de las inferencias clave disponibles.
-        En este caso, devuelve el IC de la media.
+        Implementación general; InferenciaCuantitativa e InferenciaCualitativa
+        la especializan sin comprobar el tipo de los datos en cada llamada.
         """
         res = {
             "Conteo": self._n,
@@ -125,4 +235,61 @@ class InferenciaEstadistica(EstadisticaBase):
         output += "-"*30 + "\n"
         output += "Utilice .intervalo_confianza_proporcion(valor) para IC de proporción."
         
-        return output
\ No newline at end of file
+        return output
+
+
+class InferenciaCuantitativa(InferenciaEstadistica):
+    """
+    Inferencia para datos numéricos. La instancia InferenciaEstadistica(datos)
+    devuelve esta clase cuando los datos son numéricos.
+    """
+
+    def resumen(self):
+        """
+        Proporciona un resumen de las inferencias clave disponibles.
+        En este caso, devuelve el IC de la media.
+        """
+        # _estadisticas() recorre los datos una única vez; el resto sale de su caché.
+        _, media, _, _, _ = self._estadisticas()
+        return {
+            "Conteo": self._n,
+            "Media Muestral": media,
+            f"IC Media ({int(0.95*100)}%)": self.intervalo_confianza_media(),
+        }
+
+
+class InferenciaCualitativa(InferenciaEstadistica):
+    """
+    Inferencia para datos categóricos. La instancia InferenciaEstadistica(datos)
+    devuelve esta clase cuando los datos no son numéricos.
+    """
+
+    def __init__(self, datos):
+        """Inicializa la clase y codifica las categorías como enteros pequeños."""
+        super().__init__(datos)
+
+        # Se codifican una vez para que las comparaciones de
+        # intervalo_confianza_proporcion sean de 1 byte por elemento.
+        codes, self._categories = pd.factorize(self._values)
+        self._codes = codes.astype(np.min_scalar_type(len(self._categories)), copy=False)
+
+    def intervalo_confianza_media(self, nivel_confianza=0.95):
+        """El IC de la media no está definido para datos categóricos."""
+        raise TypeError("Los datos deben ser numéricos para calcular el IC de la media.")
+
+    def _contar_exitos(self, valor_exito):
+        """Cuenta las observaciones iguales a valor_exito comparando sus códigos."""
+        posiciones = np.flatnonzero(self._categories == valor_exito)
+        if posiciones.size == 0:
+            return 0
+        return int(np.count_nonzero(self._codes == posiciones[0]))
+
+    def resumen(self):
+        """
+        Proporciona un resumen de las inferencias clave disponibles.
+        Para datos categóricos solo aplica el IC de proporción.
+        """
+        return {
+            "Conteo": self._n,
+            "IC Media": "No aplicable (Datos no numéricos)",
+        }
\ No newline at end of file
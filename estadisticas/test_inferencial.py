@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from inferencial import InferenciaEstadistica
+
+
+def _ic_por_fila(filas):
+    intervalos = [InferenciaEstadistica(fila).intervalo_confianza_media() for fila in filas]
+    return np.array([ic[0] for ic in intervalos]), np.array([ic[1] for ic in intervalos])
+
+
+@pytest.mark.parametrize("nivel_confianza", [0.90, 0.95])
+def test_batch_sin_nan_coincide_con_cada_instancia(nivel_confianza):
+    datos = np.random.default_rng(2).normal(10.0, 3.0, (4, 8))
+    inferior, superior = InferenciaEstadistica.intervalo_confianza_media_batch(datos, nivel_confianza)
+    intervalos = [InferenciaEstadistica(fila).intervalo_confianza_media(nivel_confianza) for fila in datos]
+    np.testing.assert_allclose(inferior, [ic[0] for ic in intervalos])
+    np.testing.assert_allclose(superior, [ic[1] for ic in intervalos])
+
+
+def test_batch_con_nan_descarta_nulos_por_fila():
+    datos = np.random.default_rng(3).normal(0.0, 1.0, (3, 6))
+    datos[0, 1] = np.nan
+    datos[2, [0, 4, 5]] = np.nan
+    inferior, superior = InferenciaEstadistica.intervalo_confianza_media_batch(datos)
+    esperado_inferior, esperado_superior = _ic_por_fila(datos)
+    np.testing.assert_allclose(inferior, esperado_inferior)
+    np.testing.assert_allclose(superior, esperado_superior)
+
+
+@pytest.mark.parametrize("datos", [
+    np.ones((3, 1)),
+    np.array([[1.0, 2.0, 3.0], [np.nan, np.nan, 4.0]]),
+])
+def test_batch_rechaza_filas_con_menos_de_2_observaciones(datos):
+    with pytest.raises(ValueError):
+        InferenciaEstadistica.intervalo_confianza_media_batch(datos)
+
+
+def _ic_por_grupo(datos, offsets):
+    return _ic_por_fila([datos[inicio:fin] for inicio, fin in zip(offsets[:-1], offsets[1:])])
+
+
+def test_grupos_sin_nan_coincide_con_cada_instancia():
+    datos = np.random.default_rng(4).normal(5.0, 2.0, 20)
+    offsets = [0, 2, 9, 20]
+    inferior, superior = InferenciaEstadistica.intervalo_confianza_media_grupos(datos, offsets)
+    esperado_inferior, esperado_superior = _ic_por_grupo(datos, offsets)
+    np.testing.assert_allclose(inferior, esperado_inferior)
+    np.testing.assert_allclose(superior, esperado_superior)
+
+
+def test_grupos_con_nan_descarta_nulos_por_grupo():
+    datos = np.random.default_rng(5).normal(5.0, 2.0, 20)
+    datos[[1, 3, 12, 19]] = np.nan
+    offsets = [0, 4, 9, 20]
+    inferior, superior = InferenciaEstadistica.intervalo_confianza_media_grupos(datos, offsets)
+    esperado_inferior, esperado_superior = _ic_por_grupo(datos, offsets)
+    np.testing.assert_allclose(inferior, esperado_inferior)
+    np.testing.assert_allclose(superior, esperado_superior)
+
+
+@pytest.mark.parametrize("datos, offsets", [
+    (np.arange(6.0), [1, 3, 6]),                    # no empieza en 0
+    (np.arange(6.0), [0, 3, 5]),                    # no termina en len(datos)
+    (np.arange(6.0), [0, 3, 3, 6]),                 # grupo vacío
+    (np.array([1.0, 2.0, np.nan, 4.0]), [0, 2, 2, 4]),  # grupo vacío con NaN
+    (np.array([1.0, np.nan, 3.0, 4.0]), [0, 2, 4]),     # queda 1 observación
+])
+def test_grupos_rechaza_offsets_invalidos(datos, offsets):
+    with pytest.raises(ValueError):
+        InferenciaEstadistica.intervalo_confianza_media_grupos(datos, offsets)
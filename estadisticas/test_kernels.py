@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import _kernels
+
+numba = pytest.importorskip("numba")
+
+
+def _mismos(a, b):
+    np.testing.assert_allclose(np.array(a, dtype=float), np.array(b, dtype=float),
+                               rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("x", [
+    np.array([]),
+    np.array([4.0]),
+    np.array([1.0, 2.0, 3.0, 4.0, 4.0]),
+    np.random.default_rng(0).normal(1e6, 1.0, 1000),
+    np.array([1.0, np.inf, 3.0]),
+    np.array([-np.inf, 2.0, np.inf]),
+    np.array([1e308, 1e308, -1e308]),
+])
+def test_all_stats_numba_coincide_con_numpy(x):
+    esperado = _kernels._all_stats_numpy(x)
+    _mismos(_kernels.all_stats(x), esperado)
+    solo_lectura = x.copy()
+    solo_lectura.flags.writeable = False
+    _mismos(_kernels.all_stats(solo_lectura), esperado)
+
+
+@pytest.mark.parametrize("tamanos", [[2], [3, 7, 10], [2, 2, 2, 2, 500]])
+def test_batch_stats_numba_coincide_con_numpy(tamanos):
+    offsets = np.concatenate(([0], np.cumsum(tamanos))).astype(np.int64)
+    datos = np.random.default_rng(1).normal(5.0, 2.0, offsets[-1])
+    resultados = []
+    for funcion in (_kernels.batch_stats, _kernels._batch_stats_numpy):
+        medias = np.empty(len(tamanos))
+        varianzas = np.empty(len(tamanos))
+        funcion(offsets, datos, medias, varianzas)
+        resultados.append((medias, varianzas))
+    _mismos(resultados[0], resultados[1])